@@ -0,0 +1,127 @@
+import argparse
+import sys
+from functools import lru_cache
+from typing import List, TextIO
+
+import numpy as np
+import pandas as pd
+
+from cuota.data_classes.tax_rules import TaxModel
+from cuota.logic.models import REGIMES
+
+
+# every supported model applies a social security rule followed by an income tax rule
+RULE_COLUMNS = ["social security", "income tax"]
+OUTPUT_COLUMNS = ["gross", "regime", "year", *RULE_COLUMNS, "net", "effective rate", "marginal rate"]
+
+
+@lru_cache(maxsize=None)
+def get_model(regime: str, year: int) -> TaxModel:
+    """Builds the model for a regime and year once per process."""
+    try:
+        factory = REGIMES[regime]
+    except KeyError:
+        raise ValueError(f"Unknown regime '{regime}', expected one of: {', '.join(REGIMES)}")
+    try:
+        return factory(year)
+    except FileNotFoundError:
+        raise ValueError(f"No tax data for regime '{regime}' in {year}")
+
+
+def calculate_chunk(chunk: pd.DataFrame, regime: str, year: int) -> pd.DataFrame:
+    """
+    Calculates payable, net and rates for a chunk of gross incomes.
+
+    Args:
+        chunk (pd.DataFrame): Must contain a `gross` column; `regime` and `year` columns override the defaults.
+        regime (str): The regime used for rows without one.
+        year (int): The tax year used for rows without one.
+
+    Returns:
+        pd.DataFrame: One row per input row with the columns in `OUTPUT_COLUMNS`.
+    """
+    gross = chunk["gross"].to_numpy(dtype=float)
+    regimes = chunk["regime"].fillna(regime).astype(str) if "regime" in chunk else pd.Series(regime, index=chunk.index)
+    years = chunk["year"].fillna(year).astype(int) if "year" in chunk else pd.Series(year, index=chunk.index)
+    out = {column: np.zeros(len(chunk)) for column in [*RULE_COLUMNS, "net", "effective rate", "marginal rate"]}
+
+    keys = pd.DataFrame({"regime": regimes.to_numpy(), "year": years.to_numpy()})
+    for (group_regime, group_year), positions in keys.groupby(["regime", "year"]).indices.items():
+        model = get_model(group_regime, int(group_year))
+        amounts = gross[positions]
+        results = model.results_array(amounts)
+        for column, rule in zip(RULE_COLUMNS, model.tax_rules):
+            out[column][positions] = results[rule.name]
+        out["net"][positions] = results["take home"]
+        out["effective rate"][positions] = results["effective rate"]
+        out["marginal rate"][positions] = model.marginal_rate_array(amounts)
+
+    return pd.DataFrame({"gross": gross, "regime": regimes.to_numpy(), "year": years.to_numpy(), **out},
+                        columns=OUTPUT_COLUMNS)
+
+
+def run(source: TextIO, sink: TextIO, regime: str = "autonomo", year: int = 2025, chunksize: int = 100000,
+        output_format: str = "csv", header: bool = True) -> int:
+    """
+    Streams gross incomes from `source` to results on `sink`, one chunk at a time.
+
+    Args:
+        source (TextIO): CSV input with a `gross` column and optional `regime` and `year` columns.
+            Without a header, columns are read positionally as gross, regime, year.
+        sink (TextIO): Where CSV or JSON lines are written.
+        regime (str): Default regime for rows without one. Defaults to "autonomo".
+        year (int): Default tax year for rows without one. Defaults to 2025.
+        chunksize (int): Number of rows held in memory at once. Defaults to 100,000.
+        output_format (str): "csv" or "jsonl". Defaults to "csv".
+        header (bool): Whether the input has a header row. Defaults to True.
+
+    Returns:
+        int: The number of rows processed.
+    """
+    read_kwargs = {"chunksize": chunksize, "skipinitialspace": True}
+    if not header:
+        read_kwargs.update(header=None, names=["gross", "regime", "year"])
+    rows = 0
+    for i, chunk in enumerate(pd.read_csv(source, **read_kwargs)):
+        chunk.columns = [str(c).strip().lower() for c in chunk.columns]
+        if "gross" not in chunk:
+            raise ValueError("Input must have a 'gross' column")
+        results = calculate_chunk(chunk, regime=regime, year=year)
+        if output_format == "jsonl":
+            results.to_json(sink, orient="records", lines=True, force_ascii=False)
+        else:
+            results.to_csv(sink, header=i == 0, index=False)
+        rows += len(results)
+    return rows
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="cuota", description="Calculate social security and income tax for a stream of gross incomes."
+    )
+    parser.add_argument("input", nargs="?", default="-", help="CSV file of gross incomes, or '-' for stdin")
+    parser.add_argument("--regime", default="autonomo", choices=list(REGIMES), help="default regime")
+    parser.add_argument("--year", type=int, default=2025, help="default tax year")
+    parser.add_argument("--format", dest="output_format", default="csv", choices=["csv", "jsonl"])
+    parser.add_argument("--chunksize", type=int, default=100000, help="rows processed at a time")
+    parser.add_argument("--no-header", dest="header", action="store_false",
+                        help="input has no header; columns are gross[,regime[,year]]")
+    args = parser.parse_args(argv)
+
+    try:
+        source = sys.stdin if args.input == "-" else open(args.input, "r")
+    except OSError as e:
+        parser.exit(status=1, message=f"cuota: error: cannot read '{args.input}': {e.strerror}\n")
+    try:
+        run(source, sys.stdout, regime=args.regime, year=args.year, chunksize=args.chunksize,
+            output_format=args.output_format, header=args.header)
+    except ValueError as e:
+        parser.exit(status=1, message=f"cuota: error: {e}\n")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
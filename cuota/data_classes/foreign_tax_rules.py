@@ -1,5 +1,8 @@
+import numpy as np
+
 from cuota.data_classes.tax_rules import BandsGroup, TaxModel, AllowanceFunction
 from cuota.importers.import_tax_data import get_income_tax_bands
+from cuota.importers.manifest import get_resource
 
 from PyCurrenciesTools import get_exchange_rate
 from PyCurrenciesTools.data import CurrenciesTags
@@ -31,35 +34,42 @@ class BritishPersonalAllowance(AllowanceFunction):
                 allowance = 0
         return allowance
 
+    def function_array(self, taxable: np.ndarray) -> np.ndarray:
+        difference = np.maximum(np.asarray(taxable) - 100000, 0)
+        return np.maximum(12570 - difference, 0)
+
+    def breakpoints(self) -> list[float]:
+        return [100000, 112570]
+
 
 def get_UK_income_tax() -> BandsGroup:
-    path = "uk_income_tax_2025.csv"
+    path = get_resource("UK", "income_tax", 2025)
     return get_income_tax_bands(fn=path, allowance=BritishPersonalAllowance())
 
 def get_UK_employee_NI() -> BandsGroup:
-    path = "uk_employee_NI2025.csv"
+    path = get_resource("UK", "social_security", 2025, regime="employee")
     return get_income_tax_bands(fn=path, allowance=0, name="National Insurance")
 
 def get_UK_selfemployed_NI() -> BandsGroup:
-    path = "uk_self-employed_NI2025.csv"
+    path = get_resource("UK", "social_security", 2025, regime="self-employed")
     return get_income_tax_bands(fn=path, allowance=0, name="National Insurance")
 
 
 class UkEmployeeTaxModel(TaxModel):
 
-    def __init__(self):
+    def __init__(self, rate: float | None = None):
         ni = get_UK_employee_NI()
         it = get_UK_income_tax()
         super().__init__(tax_rules=[ni, it], year=2025, non_sequential=True, name="UK employee")
-        self.convert(rate=get_conversion_rate())
+        self.convert(rate=get_conversion_rate() if rate is None else rate)
 
 class UkSelfEmployedTaxModel(TaxModel):
 
-    def __init__(self):
+    def __init__(self, rate: float | None = None):
         ni = get_UK_selfemployed_NI()
         it = get_UK_income_tax()
         super().__init__(tax_rules=[ni, it], year=2025, non_sequential=True, name="UK self-employed")
-        self.convert(rate=get_conversion_rate())
+        self.convert(rate=get_conversion_rate() if rate is None else rate)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,18 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+
 class AllowanceFunction(ABC):
     """Interface for classes that provide method for generating allowance from taxable amount."""
     @abstractmethod
     def function(self, taxable: int) -> int:
-        pass
\ No newline at end of file
+        pass
+
+    def function_array(self, taxable: np.ndarray) -> np.ndarray:
+        """Vectorised version of `function`. Override with a numpy implementation where possible."""
+        return np.vectorize(self.function, otypes=[float])(taxable)
+
+    def breakpoints(self) -> list[float]:
+        """Taxable amounts at which the allowance changes slope. Empty if the allowance is linear."""
+        return []
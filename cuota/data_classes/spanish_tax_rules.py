@@ -1,6 +1,9 @@
+import numpy as np
+
 from cuota.data_classes.interfaces import AllowanceFunction
 from cuota.data_classes.tax_rules import TaxModel, BandsGroup, Band
 from cuota.importers.import_tax_data import get_social_security_bands, get_income_tax_bands
+from cuota.importers.manifest import get_resource
 
 
 class SpanishAutonomoAllowance(AllowanceFunction):
@@ -12,19 +15,29 @@ class SpanishAutonomoAllowance(AllowanceFunction):
         min_all = SpanishMinAllowance().function(taxable=0) if self.allowance is None else self.allowance
         return min_all + 2000 if taxable * 0.7 > 2000 else min_all + int(taxable * 0.7)
 
+    def function_array(self, taxable: np.ndarray) -> np.ndarray:
+        min_all = SpanishMinAllowance().function(taxable=0) if self.allowance is None else self.allowance
+        return min_all + np.minimum(np.trunc(np.asarray(taxable) * 0.7), 2000)
+
+    def breakpoints(self) -> list[float]:
+        return [2000 / 0.7]
+
 
 class SpanishMinAllowance(AllowanceFunction):
 
     def function(self, taxable: int) -> int:
         return 5500
 
+    def function_array(self, taxable: np.ndarray) -> np.ndarray:
+        return np.full(np.shape(taxable), 5500)
+
 
 class SpanishAutonomoModel(TaxModel):
 
     def __init__(self, year: int, allowance: int | None=None):
-        ss_path = f"cuotas{year}.csv"
+        ss_path = get_resource("ES", "social_security", year, regime="autonomo")
         ss = get_social_security_bands(fn=ss_path, annualized=True)
-        irpf_path = f"irpf_tramos{year}.csv"
+        irpf_path = get_resource("ES", "income_tax", year)
         irpf = get_income_tax_bands(fn=irpf_path, allowance=SpanishAutonomoAllowance(allowance=allowance))
         tax_rules = [ss, irpf]
         super().__init__(tax_rules=tax_rules, year=year, name="Spanish autónomo")
@@ -37,7 +50,7 @@ class SpanishRegimenGeneralModel(TaxModel):
         band1 = Band(floor=0, ceiling=cap, rate=rate, exclusive=True)
         band2 = Band(floor=cap, celing=200000, flat_charge=rate * cap)
         ss_bandsgroup = BandsGroup(bands=[band1, band2], name="Régimen General")
-        irpf_path = f"irpf_tramos{year}.csv"
+        irpf_path = get_resource("ES", "income_tax", year)
         irpf = get_income_tax_bands(fn=irpf_path, allowance=5500)
         tax_rules = [ss_bandsgroup, irpf]
         super().__init__(tax_rules=tax_rules, year=year, name="Spanish employee")
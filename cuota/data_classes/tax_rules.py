@@ -1,12 +1,13 @@
 from bdb import effective
 
 import matplotlib.pyplot as plt
-from pydantic import BaseModel, model_validator, ConfigDict
-from typing import List, Self, Dict
+from pydantic import BaseModel, model_validator, ConfigDict, PrivateAttr
+from typing import List, Self, Dict, Tuple
 import pandas as pd
 import numpy as np
 
 from cuota.data_classes.interfaces import AllowanceFunction
+from cuota.logic.downsampling import downsample
 
 
 class Band(BaseModel):
@@ -101,6 +102,50 @@ class Band(BaseModel):
             self.flat_charge = int(self.flat_charge * rate)
 
 
+# columns of the array form of a group of bands; rate is NaN for flat-charge bands and vice versa
+BAND_COLUMNS = ("floor", "ceiling", "rate", "flat_charge", "exclusive")
+
+
+def get_bands_payable_array(bands: np.ndarray, taxable: np.ndarray, truncate: bool = True) -> np.ndarray:
+    """
+    Calculates the total payable across bands held in array form, as returned by `BandsGroup.to_array`.
+
+    Args:
+        bands (np.ndarray): Array of shape (n_bands, len(BAND_COLUMNS)).
+        taxable (np.ndarray): The amounts, after allowance, to calculate the payable values for.
+        truncate (bool): If True, truncates each band's charge like `Band.get_payable`. Defaults to True.
+
+    Returns:
+        np.ndarray: The total payable amount for each input value.
+    """
+    taxable = np.asarray(taxable, dtype=float)[..., None]
+    floor, ceiling, rate, flat_charge, exclusive = bands.T
+    within = (taxable > floor) & (taxable <= ceiling)
+    flat = np.isnan(rate)
+    graduated = (np.clip(taxable, floor, ceiling) - floor) * rate
+    payable = np.where(exclusive.astype(bool), np.where(within, rate * taxable, 0), graduated)
+    if truncate:
+        payable = np.trunc(payable)
+    payable = np.where(flat, np.where(within, flat_charge, 0), payable)
+    return payable.sum(axis=-1)
+
+
+def get_allowance_array(allowance: int | AllowanceFunction, amounts: np.ndarray) -> np.ndarray:
+    """
+    Calculates a fixed or function allowance for each amount.
+
+    Args:
+        allowance (int | AllowanceFunction): The allowance, as held by `BandsGroup`.
+        amounts (np.ndarray): The amounts to calculate the allowance for.
+
+    Returns:
+        np.ndarray: The allowance applicable to each amount.
+    """
+    if isinstance(allowance, AllowanceFunction):
+        return allowance.function_array(amounts)
+    return np.full(np.shape(amounts), allowance)
+
+
 class BandsGroup(BaseModel):
     """
     Represents a group of tax bands with an optional allowance.
@@ -167,6 +212,71 @@ class BandsGroup(BaseModel):
         allowance = self.allowance.function(amount) if isinstance(self.allowance, AllowanceFunction) else self.allowance
         return sum(b.get_payable(amount - allowance) for b in self.bands)
 
+    def get_allowance_array(self, amounts: np.ndarray) -> np.ndarray:
+        """
+        Calculates the allowance for each amount.
+
+        Args:
+            amounts (np.ndarray): The amounts to calculate the allowance for.
+
+        Returns:
+            np.ndarray: The allowance applicable to each amount.
+        """
+        return get_allowance_array(self.allowance, amounts)
+
+    def get_payable_array(self, amounts: np.ndarray, truncate: bool = True) -> np.ndarray:
+        """
+        Vectorised version of `get_payable`.
+
+        Args:
+            amounts (np.ndarray): The amounts to calculate the payable values for.
+            truncate (bool): If True, truncates each band's charge like `get_payable`. Defaults to True.
+
+        Returns:
+            np.ndarray: The total payable amount for each input value.
+        """
+        amounts = np.asarray(amounts, dtype=float)
+        return get_bands_payable_array(self.to_array(), amounts - self.get_allowance_array(amounts), truncate)
+
+    def to_array(self) -> np.ndarray:
+        """
+        Returns the bands as an array of shape (n_bands, len(BAND_COLUMNS)).
+
+        Returns:
+            np.ndarray: One row per band; `rate` is NaN for flat-charge bands and `flat_charge` NaN otherwise.
+        """
+        return np.array([
+            [b.floor, b.ceiling,
+             np.nan if b.rate is None else b.rate,
+             np.nan if b.flat_charge is None else b.flat_charge,
+             b.exclusive]
+            for b in self.bands
+        ], dtype=float)
+
+    def breakpoints(self) -> np.ndarray:
+        """
+        Calculates the amounts, before allowance, at which the payable amount changes slope or jumps.
+
+        Band edges are mapped back through the allowance, which is assumed to leave
+        `amount - allowance` increasing in `amount`.
+
+        Returns:
+            np.ndarray: Sorted, non-negative breakpoints.
+        """
+        edges = np.unique([b.floor for b in self.bands] + [b.ceiling for b in self.bands]).astype(float)
+        if not isinstance(self.allowance, AllowanceFunction):
+            points = edges + self.allowance
+        else:
+            kinks = np.asarray(self.allowance.breakpoints(), dtype=float)
+            knots = np.unique(np.concatenate(([0.0], kinks, [kinks.max(initial=0) + 1])))
+            net_knots = knots - self.allowance.function_array(knots)
+            points = np.interp(edges, net_knots, knots)
+            # beyond the last kink the allowance is constant
+            beyond = edges > net_knots[-1]
+            points[beyond] = edges[beyond] + knots[-1] - net_knots[-1]
+            points = np.concatenate((points, kinks))
+        return np.unique(points[points >= 0])
+
     def convert(self, rate: float):
         """
         Adjusts all bands in the group by the given rate.
@@ -178,7 +288,91 @@ class BandsGroup(BaseModel):
             band.convert(rate)
 
 
-class TaxModel(BaseModel):
+class ArrayResultsMixin:
+    """
+    Vectorised results for models exposing `tax_rules` (each with `name` and `get_payable_array`)
+    and `non_sequential`. Shared by `TaxModel` and the shared-memory models in `cuota.logic.registry`.
+    """
+
+    def rule_payables(self, amounts: np.ndarray, truncate: bool = True) -> List[np.ndarray]:
+        """
+        Calculates the payable amount under each rule for an array of amounts.
+
+        Args:
+            amounts (np.ndarray): The taxable amounts.
+            truncate (bool): If True, truncates to whole units like `results`. Defaults to True.
+
+        Returns:
+            List[np.ndarray]: One array of payable amounts per rule, in the order of `tax_rules`.
+        """
+        amounts = np.asarray(amounts, dtype=float)
+        taxable = amounts
+        payables = []
+        for rule in self.tax_rules:
+            payable = rule.get_payable_array(taxable, truncate=truncate)
+            payables.append(payable)
+            if not self.non_sequential:
+                taxable = taxable - payable
+        return payables
+
+    def results_array(self, amounts: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Vectorised version of `results`.
+
+        Args:
+            amounts (np.ndarray): The taxable amounts.
+
+        Returns:
+            Dict[str, np.ndarray]: The same keys as `results`, each holding one value per amount.
+        """
+        amounts = np.asarray(amounts, dtype=float)
+        nonzero = amounts != 0
+        result = {}
+        total = np.zeros(amounts.shape)
+        for rule, payable in zip(self.tax_rules, self.rule_payables(amounts)):
+            result[rule.name] = payable
+            result[f"{rule.name} effective rate"] = np.divide(
+                payable, amounts, out=np.zeros(amounts.shape), where=nonzero
+            )
+            total = total + payable
+        result.update({
+            "total payable": total,
+            "take home": amounts - total,
+            "effective rate": np.divide(total, amounts, out=np.zeros(amounts.shape), where=amounts > 0)
+        })
+        return result
+
+    def take_home_array(self, amounts: np.ndarray) -> np.ndarray:
+        """
+        Calculates the take-home amount for an array of amounts.
+
+        Args:
+            amounts (np.ndarray): The taxable amounts.
+
+        Returns:
+            np.ndarray: The amount left after all rules have been applied.
+        """
+        amounts = np.asarray(amounts, dtype=float)
+        return amounts - sum(self.rule_payables(amounts))
+
+    def marginal_rate_array(self, amounts: np.ndarray, delta: int = 100) -> np.ndarray:
+        """
+        Vectorised version of `marginal_rate`.
+
+        Args:
+            amounts (np.ndarray): The base taxable amounts.
+            delta (int): The incremental change in the taxable amount. Defaults to 100.
+
+        Returns:
+            np.ndarray: The marginal tax rate for each amount.
+        """
+        amounts = np.asarray(amounts, dtype=float)
+        r1 = sum(self.rule_payables(amounts))
+        r2 = sum(self.rule_payables(amounts + delta))
+        return (r2 - r1) / delta
+
+
+class TaxModel(ArrayResultsMixin, BaseModel):
     """
     Represents a tax model consisting of multiple bands groups.
 
@@ -250,6 +444,38 @@ class TaxModel(BaseModel):
         r2 = self.results(amount + delta)["total payable"]
         return (r2 - r1) / delta
 
+    def breakpoints(self) -> np.ndarray:
+        """
+        Calculates the gross amounts at which the total payable changes slope or jumps.
+
+        Each rule's breakpoints are mapped back to gross amounts through the rules applied
+        before it, which are linear between the breakpoints already found.
+
+        Returns:
+            np.ndarray: Sorted, non-negative breakpoints.
+        """
+        knots = np.array([0.0])
+        for i, rule in enumerate(self.tax_rules):
+            rule_points = rule.breakpoints()
+            if self.non_sequential or i == 0:
+                knots = np.union1d(knots, rule_points)
+                continue
+            # the rule's input is linear in gross on each segment between known knots:
+            # fit it from two interior points and solve for the rule's breakpoints
+            lower = knots
+            upper = np.append(knots[1:], knots[-1] + 2)
+            samples = np.stack((lower + (upper - lower) / 3, lower + 2 * (upper - lower) / 3))
+            previous = sum(self.rule_payables(samples.ravel(), truncate=False)[:i]).reshape(samples.shape)
+            taxable = samples - previous
+            slope = (taxable[1] - taxable[0]) / (samples[1] - samples[0])
+            intercept = taxable[0] - slope * samples[0]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                gross = (rule_points[None, :] - intercept[:, None]) / slope[:, None]
+            upper[-1] = np.inf
+            inside = (gross > lower[:, None]) & (gross <= upper[:, None]) & (slope[:, None] > 0)
+            knots = np.union1d(knots, gross[inside])
+        return knots
+
     def sample(self, taxable_array: List[int] | None=None, income_range: tuple | None=None) -> pd.DataFrame:
         """
         Generates a DataFrame summarizing tax calculations for a range of amounts.
@@ -293,20 +519,89 @@ class TaxModel(BaseModel):
 
 
 class IncomeSample(BaseModel):
+    """
+    Results of a `TaxModel` over a range of incomes, with plotting helpers.
+
+    Large samples are downsampled before plotting (see `cuota.logic.downsampling`), and the
+    downsampled series are cached so repeated plots of the same metric do not recompute them.
+    Assigning `df` clears the cache; call `clear_cache` after changing `df` in place.
+
+    Attributes:
+        df (pd.DataFrame): One row per income, one column per metric.
+        max_points (int): Approximate number of points plotted per metric. Defaults to 2000.
+    """
     df: pd.DataFrame
+    max_points: int = 2000
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    _series: Dict[Tuple[str, int], Tuple[np.ndarray, np.ndarray]] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ("df", "max_points"):
+            self.clear_cache()
+
+    def clear_cache(self):
+        """Discards the cached downsampled series."""
+        self._series.clear()
+
+    def series(self, metric: str, max_points: int | None = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the (downsampled) incomes and values of a metric, computing them once.
+
+        Args:
+            metric (str): The column to return.
+            max_points (int | None): Overrides `max_points`.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The incomes and metric values to plot.
+        """
+        key = (metric, self.max_points if max_points is None else max_points)
+        if key not in self._series:
+            self._series[key] = downsample(self.df.index.to_numpy(), self.df[metric].to_numpy(), n_out=key[1])
+        return self._series[key]
 
     def plot_metric(self, ax: plt.Axes, metric: str):
-        df = self.df
-        ax.plot(df.index, df[metric], label=metric)
-        plt.title(metric)
+        x, y = self.series(metric)
+        ax.plot(x, y, label=metric)
+        ax.set_title(metric)
         return ax
 
-    #  todo: fix this
-    def plot_all(self):
-        df = self.df
-        for metric in df.columns:
+    def plot_metrics(self, metrics: List[str] | None = None, ax: plt.Axes | None = None) -> plt.Axes:
+        """
+        Plots several metrics on shared axes.
+
+        Args:
+            metrics (List[str] | None): The columns to plot. Defaults to all columns.
+            ax (plt.Axes | None): The axes to draw on. Defaults to a new figure.
+
+        Returns:
+            plt.Axes: The axes drawn on.
+        """
+        if ax is None:
             _, ax = plt.subplots()
-            self.plot_metric(ax=ax, metric=metric)
+        for metric in self.df.columns if metrics is None else metrics:
+            ax.plot(*self.series(metric), label=metric)
+        ax.legend()
+        ax.grid(True)
+        return ax
+
+    def plot_all(self) -> plt.Figure:
+        """
+        Plots every metric in a single figure: amounts on the left axis and rates on the right.
+
+        Returns:
+            plt.Figure: The figure drawn.
+        """
+        rates = [metric for metric in self.df.columns if "rate" in metric]
+        amounts = [metric for metric in self.df.columns if metric not in rates]
+        fig, ax = plt.subplots()
+        if amounts:
+            self.plot_metrics(amounts, ax=ax)
+        if rates:
+            rate_ax = ax.twinx() if amounts else ax
+            for metric in rates:
+                rate_ax.plot(*self.series(metric), label=metric, linestyle="--")
+            rate_ax.legend(loc="lower right")
+        return fig
 
 # todo: fix top range of social security
@@ -1,5 +1,6 @@
 from cuota.data_classes.interfaces import AllowanceFunction
 from cuota.data_classes.tax_rules import Band, BandsGroup, TaxModel
+from cuota.importers.manifest import load_manifest, get_resource, get_years
 import importlib.resources as resources
 
 import pandas as pd
@@ -39,10 +40,10 @@ def get_social_security_bands(fn: str=fn2, annualized: bool=True, name: str="Soc
 
 def get_from_files(regex: str) \
         -> List[Tuple]:
-    """Get all files that match a pattern from the data dir and return a list of BandsGroups
+    """Get all indexed resources whose file name matches a pattern and return a list of (BandsGroup, year)
     """
-    p = resources.files("cuota.resources")
-    files_matches = [(f,  re.match(regex, str(f)).group(1)) for f in p.iterdir() if re.match(regex, str(f))]
+    files_matches = [(f, year) for (_, _, _, year), f in sorted(load_manifest().items(), key=lambda i: i[1])
+                     if re.match(regex, f)]
     if "cuotas" in regex:
         return [(get_social_security_bands(fn=f, annualized=True), year) for f, year in files_matches]
     else:
@@ -50,26 +51,31 @@ def get_from_files(regex: str) \
 
 def get_all_social_security_data(as_tax_model: bool=True) \
         -> List[TaxModel] | List[BandsGroup]:
-    """Get all files that match a pattern from the data dir and return a list of TaxModels (defualt)
-    or a list of BandsGroups
+    """Get all Spanish autónomo social security resources from the manifest and return a list of TaxModels
+    (defualt) or a list of BandsGroups
     """
-    regex = r"^.*cuotas(20[0-9][0-9]).*\.csv$"
-    years_bandsgroups = get_from_files(regex=regex)
+    years = get_years("ES", "social_security", regime="autonomo")
+    bandsgroups = [get_social_security_bands(fn=get_resource("ES", "social_security", year, regime="autonomo"))
+                   for year in years]
     if not as_tax_model:
-        return [bandsgroup for bandsgroup, _ in years_bandsgroups]
+        return bandsgroups
     else:
-        data = [TaxModel(year=year, tax_rules=[taxrules]) for taxrules, year in years_bandsgroups]
+        data = [TaxModel(year=year, tax_rules=[taxrules]) for taxrules, year in zip(bandsgroups, years)]
         return data
 
 def get_spanish_data_by_year() -> List[TaxModel]:
-    regex_ss = r"^.*cuotas(20[0-9][0-9]).*\.csv$"
-    regex_irpf = r"^.*irpf_tramos(20[0-9][0-9]).*\.csv$"
-    ss_years = get_from_files(regex=regex_ss)
-    irpf_years = get_from_files(regex_irpf)
-    combined = [s + i for s, i in zip(ss_years, irpf_years)]
-    if [year for _, year in ss_years] != [year for _, year in irpf_years]:
-        raise Exception("social security and irpf years do not match, please check files")
-    data = [TaxModel(tax_rules=[ss, irpf], year=year) for ss, _, irpf, year in combined]
+    """Social security and IRPF are matched by year; raises an Exception if either lacks a year the other has."""
+    ss_years = get_years("ES", "social_security", regime="autonomo")
+    irpf_years = get_years("ES", "income_tax")
+    if ss_years != irpf_years:
+        raise Exception(f"social security and irpf years do not match, please check files: "
+                        f"social security only {sorted(set(ss_years) - set(irpf_years))}, "
+                        f"irpf only {sorted(set(irpf_years) - set(ss_years))}")
+    data = []
+    for year in ss_years:
+        ss = get_social_security_bands(fn=get_resource("ES", "social_security", year, regime="autonomo"))
+        irpf = get_income_tax_bands(fn=get_resource("ES", "income_tax", year))
+        data.append(TaxModel(tax_rules=[ss, irpf], year=year))
     return data
 
 # TODO: fetch the data from the irpf_tramos files and add the appropriate bandsgroups to the taxmodels
@@ -80,10 +86,8 @@ def get_spanish_regimen_general() -> List[TaxModel]:
     band1 = Band(floor=0, ceiling=cap, rate=rate, exclusive=True)
     band2 = Band(floor=cap, celing=200000, flat_charge=rate * cap)
     ss_bandsgroup = BandsGroup(bands=[band1, band2], name="Régimen General")
-    regex_irpf = r"^.*irpf_tramos(20[0-9][0-9]).*\.csv$"
-    irpf_years = get_from_files(regex_irpf)
-    irpf_dict = {int(year): bg for bg, year in irpf_years}
-    return [TaxModel(tax_rules=[ss_bandsgroup, irpf_dict[year]], year=year) for year in years]
+    return [TaxModel(tax_rules=[ss_bandsgroup, get_income_tax_bands(fn=get_resource("ES", "income_tax", year))],
+                     year=year) for year in years]
 
 
 if __name__ == "__main__":
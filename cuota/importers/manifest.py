@@ -0,0 +1,86 @@
+import csv
+import importlib.resources as resources
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+ANY_REGIME = "any"
+MANIFEST = "manifest.csv"
+FIELDS = ["jurisdiction", "regime", "kind", "year", "file"]
+
+# (filename pattern, jurisdiction, regime, kind); the first group of the pattern, if any, is the year
+PATTERNS = [
+    (r"^cuotas(20[0-9][0-9])\.csv$", "ES", "autonomo", "social_security"),
+    (r"^irpf_tramos(20[0-9][0-9])?\.csv$", "ES", ANY_REGIME, "income_tax"),
+    (r"^uk_employee_NI(20[0-9][0-9])\.csv$", "UK", "employee", "social_security"),
+    (r"^UK_self-employed_NI(20[0-9][0-9])\.csv$", "UK", "self-employed", "social_security"),
+    (r"^uk_income_tax_(20[0-9][0-9])\.csv$", "UK", ANY_REGIME, "income_tax"),
+]
+
+Key = Tuple[str, str, str, int | None]
+
+
+def scan_resources() -> List[Dict]:
+    """Match every file in the resources directory against `PATTERNS`. Used to (re)generate the manifest."""
+    entries = []
+    for f in sorted(p.name for p in resources.files("cuota.resources").iterdir()):
+        for regex, jurisdiction, regime, kind in PATTERNS:
+            match = re.match(regex, f)
+            if match:
+                year = match.group(1) if match.groups() else None
+                entries.append({"jurisdiction": jurisdiction, "regime": regime, "kind": kind,
+                                "year": int(year) if year else None, "file": f})
+                break
+    return entries
+
+
+def write_manifest() -> None:
+    """Regenerate the manifest. Run after adding or renaming a resource file."""
+    path = resources.files("cuota.resources").joinpath(MANIFEST)
+    with path.open("w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(scan_resources())
+
+
+@lru_cache(maxsize=None)
+def load_manifest() -> Dict[Key, str]:
+    """Read the manifest once into a dict keyed by (jurisdiction, regime, kind, year)."""
+    with resources.files("cuota.resources").joinpath(MANIFEST).open("r", newline="") as file:
+        return {
+            (row["jurisdiction"], row["regime"], row["kind"], int(row["year"]) if row["year"] else None): row["file"]
+            for row in csv.DictReader(file)
+        }
+
+
+def get_resource(jurisdiction: str, kind: str, year: int | None, regime: str = ANY_REGIME) -> str:
+    """
+    Look up the resource file for a rule.
+
+    Regime-specific entries take precedence over entries shared by all regimes.
+
+    :param jurisdiction: "ES" or "UK"
+    :param kind: "social_security" or "income_tax"
+    :param year: tax year, or None for the undated default
+    :param regime: e.g. "autonomo", "employee"
+    :return: file name within cuota.resources
+    :raises FileNotFoundError: if no resource is indexed for the key
+    """
+    manifest = load_manifest()
+    fn = manifest.get((jurisdiction, regime, kind, year)) or manifest.get((jurisdiction, ANY_REGIME, kind, year))
+    if fn is None:
+        raise FileNotFoundError(f"No {kind} resource for {jurisdiction} {regime} in {year}")
+    return fn
+
+
+def get_years(jurisdiction: str, kind: str, regime: str = ANY_REGIME) -> List[int]:
+    """All years for which a resource is indexed, in ascending order."""
+    return sorted({
+        year for (j, r, k, year) in load_manifest()
+        if j == jurisdiction and k == kind and r in (regime, ANY_REGIME) and year is not None
+    })
+
+
+if __name__ == "__main__":
+    write_manifest()
+    print(load_manifest())
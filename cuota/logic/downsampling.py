@@ -0,0 +1,89 @@
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Selects the points to keep using largest-triangle-three-buckets.
+
+    The first and last points are always kept; every other bucket keeps the point forming the
+    largest triangle with the previously kept point and the average of the next bucket.
+
+    Args:
+        x (np.ndarray): Increasing x values.
+        y (np.ndarray): The y values.
+        n_out (int): Number of points to keep.
+
+    Returns:
+        np.ndarray: Sorted indices of the points to keep.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    bins = np.linspace(1, n - 1, n_out - 1).astype(int)
+    # averages of each bucket, with the last point as the bucket after the final one
+    counts = np.diff(np.append(bins, n))
+    avg_x = np.add.reduceat(x, bins) / counts
+    avg_y = np.add.reduceat(y, bins) / counts
+    indices = np.empty(n_out, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = bins[i], bins[i + 1]
+        area = np.abs((x[a] - avg_x[i + 1]) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y[i + 1] - y[a]))
+        a = start + int(area.argmax())
+        indices[i + 1] = a
+    return indices
+
+
+def step_edges(y: np.ndarray, step_factor: float = 4, max_jumps: int | None = None) -> np.ndarray:
+    """
+    Finds the indices either side of jumps in `y`.
+
+    Each change is scored by how much it exceeds the larger of its neighbouring changes, so steep
+    but smooth stretches score close to zero and a step scores its height. A jump is a score above
+    `step_factor` times the 99th percentile of the scores: model output truncated to whole units
+    scores 0 or 1 unit at most points, so rounding noise sets the percentile and only genuine steps
+    (e.g. a flat charge starting) exceed it.
+
+    Args:
+        y (np.ndarray): The y values.
+        step_factor (float): How much larger than the typical score a jump must be. Defaults to 4.
+        max_jumps (int | None): Keep only this many of the highest-scoring jumps. Defaults to all.
+
+    Returns:
+        np.ndarray: Sorted indices of the points before and after each jump.
+    """
+    diff = np.abs(np.diff(np.asarray(y, dtype=float)))
+    if len(diff) < 3:
+        return np.array([], dtype=int)
+    padded = np.concatenate(([diff[1]], diff, [diff[-2]]))
+    score = diff - np.maximum(padded[:-2], padded[2:])
+    # a strided subsample is enough to estimate the percentile of a long series
+    typical = np.percentile(score[::max(1, len(score) // 10000)], 99)
+    jumps = np.flatnonzero(score > step_factor * max(typical, 0))
+    if max_jumps is not None and len(jumps) > max_jumps:
+        jumps = np.sort(jumps[np.argsort(score[jumps])[-max_jumps:]])
+    return np.union1d(jumps, jumps + 1)
+
+
+def downsample(x: np.ndarray, y: np.ndarray, n_out: int = 2000) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduces a series to about `n_out` points, preserving its shape and the edges of any steps.
+
+    Args:
+        x (np.ndarray): Increasing x values.
+        y (np.ndarray): The y values.
+        n_out (int): Number of points to select with LTTB. Both sides of up to `n_out` of the largest
+            steps are added on top. Defaults to 2000.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The downsampled x and y values.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) <= n_out:
+        return x, y
+    indices = np.union1d(lttb(x, y, n_out), step_edges(y, max_jumps=n_out))
+    return x[indices], y[indices]
@@ -0,0 +1,61 @@
+from typing import Callable, Dict, List, Tuple
+
+from cuota.data_classes.tax_rules import TaxModel
+from cuota.data_classes.spanish_tax_rules import SpanishAutonomoModel, SpanishRegimenGeneralModel
+from cuota.importers.manifest import get_years
+
+
+def _uk_conversion_rate(year: int, regime: str) -> float:
+    if year not in get_years("UK", "social_security", regime=regime):
+        raise FileNotFoundError(f"No UK {regime} resources for {year}")
+    # imported lazily: PyCurrenciesTools fetches the exchange rate over the network
+    from cuota.data_classes.foreign_tax_rules import get_conversion_rate
+    rate = get_conversion_rate()
+    if not rate:
+        raise ValueError("Could not fetch the GBP to EUR exchange rate for the UK models")
+    return rate
+
+
+def _uk_employee(year: int) -> TaxModel:
+    rate = _uk_conversion_rate(year, regime="employee")
+    from cuota.data_classes.foreign_tax_rules import UkEmployeeTaxModel
+    return UkEmployeeTaxModel(rate=rate)
+
+
+def _uk_self_employed(year: int) -> TaxModel:
+    rate = _uk_conversion_rate(year, regime="self-employed")
+    from cuota.data_classes.foreign_tax_rules import UkSelfEmployedTaxModel
+    return UkSelfEmployedTaxModel(rate=rate)
+
+
+REGIMES: Dict[str, Callable[[int], TaxModel]] = {
+    "autonomo": SpanishAutonomoModel,
+    "general": SpanishRegimenGeneralModel,
+    "uk-employee": _uk_employee,
+    "uk-self-employed": _uk_self_employed,
+}
+
+Key = Tuple[str, int]
+
+
+def regime_years(regime: str) -> List[int]:
+    """The years for which a regime has data in the resource manifest."""
+    if regime == "autonomo":
+        return get_years("ES", "social_security", regime="autonomo")
+    if regime == "general":
+        return get_years("ES", "income_tax")
+    return get_years("UK", "income_tax")
+
+
+def load_models(regimes: List[str] | None = None) -> Dict[Key, TaxModel]:
+    """
+    Builds a model for every year of each regime.
+
+    Args:
+        regimes (List[str] | None): Keys of `REGIMES`. Defaults to the Spanish regimes, which need no network access.
+
+    Returns:
+        Dict[Key, TaxModel]: Models keyed by (regime, year).
+    """
+    regimes = ["autonomo", "general"] if regimes is None else regimes
+    return {(regime, year): REGIMES[regime](year) for regime in regimes for year in regime_years(regime)}
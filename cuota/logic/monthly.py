@@ -0,0 +1,98 @@
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+from cuota.data_classes.tax_rules import BandsGroup
+from cuota.importers.import_tax_data import get_social_security_bands
+from cuota.importers.manifest import get_resource
+
+MONTHS = 12
+
+
+class MonthlyContributions(BaseModel):
+    """
+    Autónomo contributions charged month by month, with the annual regularization.
+
+    Attributes:
+        monthly (np.ndarray): Cuota charged for each person and month, shape (people, 12).
+        paid (np.ndarray): Total charged over the year for each person.
+        due (np.ndarray): Twelve times the cuota for the bracket of each person's average monthly income.
+        regularization (np.ndarray): `due - paid`; positive amounts are owed, negative amounts refunded.
+    """
+    monthly: np.ndarray
+    paid: np.ndarray
+    due: np.ndarray
+    regularization: np.ndarray
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class MonthlyContributionEngine:
+    """
+    Applies a year's monthly cuota table (`cuotasYYYY.csv`) to monthly incomes.
+
+    Unlike `SpanishAutonomoModel`, which annualizes the table and applies it to annual income,
+    contributions are charged each month on that month's declared income and regularized at the
+    end of the year against the bracket of the actual average monthly income.
+
+    Args:
+        year (int): The tax year of the cuota table.
+        bands (BandsGroup | None): A monthly flat-charge table to use instead of the year's resource.
+    """
+
+    def __init__(self, year: int, bands: BandsGroup | None = None):
+        self.year = year
+        if bands is None:
+            fn = get_resource("ES", "social_security", year, regime="autonomo")
+            bands = get_social_security_bands(fn=fn, annualized=False)
+        if any(band.flat_charge is None for band in bands.bands):
+            raise ValueError("Monthly cuota tables must only contain flat-charge bands.")
+        self.ceilings = np.array([band.ceiling for band in bands.bands], dtype=float)
+        self.charges = np.array([band.flat_charge for band in bands.bands], dtype=float)
+
+    def get_cuota(self, incomes: np.ndarray) -> np.ndarray:
+        """
+        Looks up the monthly cuota for each monthly income.
+
+        Unlike `Band.get_payable`, zero or negative income still owes the lowest tramo, and income
+        above the last ceiling owes the highest.
+
+        Args:
+            incomes (np.ndarray): Monthly incomes of any shape.
+
+        Returns:
+            np.ndarray: The cuota for each income, same shape as `incomes`.
+        """
+        incomes = np.asarray(incomes, dtype=float)
+        # bands are contiguous, so the first ceiling >= income identifies floor < income <= ceiling
+        index = np.searchsorted(self.ceilings, incomes, side="left")
+        return self.charges[np.minimum(index, len(self.charges) - 1)]
+
+    def calculate(self, incomes: np.ndarray, declared: np.ndarray | None = None) -> MonthlyContributions:
+        """
+        Calculates the monthly charges and annual regularization for many taxpayers at once.
+
+        Args:
+            incomes (np.ndarray): Actual monthly net income, shape (people, 12).
+            declared (np.ndarray | None): Income declared for each month, on which the monthly cuota
+                is charged, shape (people, 12). Defaults to `incomes`.
+
+        Returns:
+            MonthlyContributions: Charges per person and month, and per-person annual totals.
+        """
+        incomes = np.asarray(incomes, dtype=float)
+        declared = incomes if declared is None else np.asarray(declared, dtype=float)
+        if incomes.ndim != 2 or incomes.shape[1] != MONTHS:
+            raise ValueError(f"Incomes must have shape (people, {MONTHS}), got {incomes.shape}.")
+        if declared.shape != incomes.shape:
+            raise ValueError(f"Declared incomes must have shape {incomes.shape}, got {declared.shape}.")
+        monthly = self.get_cuota(declared)
+        paid = monthly.sum(axis=1)
+        due = self.get_cuota(incomes.mean(axis=1)) * MONTHS
+        return MonthlyContributions(monthly=monthly, paid=paid, due=due, regularization=due - paid)
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    incomes = rng.gamma(shape=2, scale=800, size=(5, MONTHS))
+    result = MonthlyContributionEngine(2025).calculate(incomes)
+    print(result.monthly)
+    print(result.regularization)
@@ -0,0 +1,112 @@
+from typing import Callable, List
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+from cuota.data_classes.tax_rules import TaxModel
+from cuota.data_classes.spanish_tax_rules import SpanishAutonomoModel, SpanishRegimenGeneralModel
+
+
+class OptimalSplit(BaseModel):
+    """
+    The split of total incomes between employment and self-employment that maximises take-home.
+
+    Attributes:
+        totals (np.ndarray): The total incomes that were split.
+        employment (np.ndarray): The income to take as employment for each total, in whole units.
+        self_employment (np.ndarray): The income to take as self-employment for each total.
+        take_home (np.ndarray): The combined take-home at the optimal split.
+        years (List[int] | None): The tax year of each row, when optimised across years.
+    """
+    totals: np.ndarray
+    employment: np.ndarray
+    self_employment: np.ndarray
+    take_home: np.ndarray
+    years: List[int] | None = None
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+def optimal_split(employment: TaxModel, self_employment: TaxModel, totals: np.ndarray) -> OptimalSplit:
+    """
+    Finds the split of each total income between two tax models that maximises the combined take-home.
+
+    Both models are piecewise linear in gross income, so the combined take-home is linear between
+    the breakpoints of either model and only those breakpoints (and the extremes) need checking.
+    Payable can drop just past a breakpoint (e.g. a charge that stops above a ceiling), so each
+    breakpoint is also checked one unit to its right, the models truncating to whole units.
+    Candidates are whole units (unless a total is not), as a split can only be invoiced in whole units.
+
+    Because each model truncates its payable to whole units, take-home is only piecewise linear to
+    within a unit, and the result can fall short of an exhaustive whole-unit search by up to 1 per
+    model (2 combined).
+
+    Args:
+        employment (TaxModel): The model applied to the employment share, e.g. `SpanishRegimenGeneralModel`.
+        self_employment (TaxModel): The model applied to the remainder, e.g. `SpanishAutonomoModel`.
+        totals (np.ndarray): The total incomes to split.
+
+    Returns:
+        OptimalSplit: The optimal employment and self-employment income and take-home for each total.
+    """
+    totals = np.asarray(totals, dtype=float)
+    flat_totals = totals.reshape(-1, 1)
+    employment_points = np.concatenate((employment.breakpoints(), employment.breakpoints() + 1))
+    self_employment_points = np.concatenate((self_employment.breakpoints(), self_employment.breakpoints() + 1))
+    candidates = np.concatenate(
+        (
+            np.zeros_like(flat_totals),
+            flat_totals,
+            np.broadcast_to(employment_points, (len(flat_totals), len(employment_points))),
+            flat_totals - self_employment_points,
+        ),
+        axis=1,
+    )
+    # a split can only be invoiced in whole units, so try the whole units either side of each candidate
+    candidates = np.clip(np.concatenate((np.floor(candidates), np.ceil(candidates)), axis=1), 0, flat_totals)
+    take_home = (
+        employment.take_home_array(candidates.ravel())
+        + self_employment.take_home_array((flat_totals - candidates).ravel())
+    ).reshape(candidates.shape)
+    best = np.argmax(take_home, axis=1)
+    rows = np.arange(len(flat_totals))
+    split = candidates[rows, best].reshape(totals.shape)
+    return OptimalSplit(
+        totals=totals,
+        employment=split,
+        self_employment=totals - split,
+        take_home=take_home[rows, best].reshape(totals.shape),
+    )
+
+
+def optimal_split_by_year(
+        totals: np.ndarray,
+        years: List[int],
+        employment_model: Callable[[int], TaxModel] = SpanishRegimenGeneralModel,
+        self_employment_model: Callable[[int], TaxModel] = SpanishAutonomoModel,
+) -> OptimalSplit:
+    """
+    Finds the optimal split of each total income for each year.
+
+    Args:
+        totals (np.ndarray): The total incomes to split.
+        years (List[int]): The tax years to build models for.
+        employment_model (Callable[[int], TaxModel]): Builds the employment model for a year.
+        self_employment_model (Callable[[int], TaxModel]): Builds the self-employment model for a year.
+
+    Returns:
+        OptimalSplit: Arrays with one row per year and one column per total.
+    """
+    splits = [optimal_split(employment_model(year), self_employment_model(year), totals) for year in years]
+    return OptimalSplit(
+        totals=np.asarray(totals, dtype=float),
+        employment=np.stack([s.employment for s in splits]),
+        self_employment=np.stack([s.self_employment for s in splits]),
+        take_home=np.stack([s.take_home for s in splits]),
+        years=list(years),
+    )
+
+
+if __name__ == "__main__":
+    result = optimal_split_by_year(totals=np.arange(12000, 90000, 6000), years=[2023, 2024, 2025])
+    print(result.employment)
+    print(result.take_home)
@@ -0,0 +1,199 @@
+from multiprocessing import shared_memory
+from typing import Dict, List
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+from cuota.data_classes.interfaces import AllowanceFunction
+from cuota.data_classes.tax_rules import (
+    TaxModel, ArrayResultsMixin, BAND_COLUMNS, get_bands_payable_array, get_allowance_array
+)
+from cuota.logic.models import Key, load_models
+
+
+class RuleLayout(BaseModel):
+    """Where a rule's bands sit in the shared array, and what is needed to evaluate them."""
+    name: str | None
+    allowance: int | AllowanceFunction
+    start: int
+    stop: int
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class ModelLayout(BaseModel):
+    name: str
+    year: int
+    non_sequential: bool
+    rules: List[RuleLayout]
+
+
+class RegistryHandle(BaseModel):
+    """
+    Small, picklable description of a published registry. Pass it to workers to attach.
+
+    Attributes:
+        shm_name (str): Name of the shared memory block holding the bands.
+        n_bands (int): Total number of bands across all models.
+        models (Dict[Key, ModelLayout]): Layout of each model's rules within the block.
+    """
+    shm_name: str
+    n_bands: int
+    models: Dict[Key, ModelLayout]
+
+
+class SharedBandsGroup:
+    """
+    A `BandsGroup` whose bands are a read-only view into shared memory. Not validated on creation.
+
+    The view is only valid while `registry` is open; evaluating afterwards raises `RuntimeError`
+    rather than reading unmapped memory.
+    """
+
+    def __init__(self, bands: np.ndarray, allowance: int | AllowanceFunction, name: str | None,
+                 registry: "ModelRegistry"):
+        self.bands = bands
+        self.allowance = allowance
+        self.name = name
+        self.registry = registry
+
+    def get_payable_array(self, amounts: np.ndarray, truncate: bool = True) -> np.ndarray:
+        if self.registry.closed:
+            raise RuntimeError("The model registry has been closed; models from it can no longer be used")
+        amounts = np.asarray(amounts, dtype=float)
+        return get_bands_payable_array(self.bands, amounts - get_allowance_array(self.allowance, amounts), truncate)
+
+
+class SharedTaxModel(ArrayResultsMixin):
+    """A ready-to-evaluate model backed by a `ModelRegistry`. Provides the vectorised methods of `TaxModel`."""
+
+    def __init__(self, tax_rules: List[SharedBandsGroup], year: int, name: str, non_sequential: bool):
+        self.tax_rules = tax_rules
+        self.year = year
+        self.name = name
+        self.non_sequential = non_sequential
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # before Python 3.13 attaching always registers the block with the resource tracker.
+        # Forked and spawned workers share the parent's tracker, where the block is already
+        # registered, so this is harmless; unregistering here would drop the parent's entry.
+        return shared_memory.SharedMemory(name=name)
+
+
+class ModelRegistry:
+    """
+    Models for all regimes and years, with their bands published once into shared memory.
+
+    The parent process calls `publish` and hands `handle` to its workers (e.g. as a pool
+    initializer argument); each worker calls `attach` and looks models up by (regime, year)
+    without reading resources or validating bands again.
+
+    Usage:
+        >>> with ModelRegistry.publish(load_models()) as registry:
+        ...     pool = Pool(initializer=init_worker, initargs=(registry.handle,))
+    """
+
+    def __init__(self, handle: RegistryHandle, shm: shared_memory.SharedMemory, owner: bool):
+        self.handle = handle
+        self._shm = shm
+        self._owner = owner
+        self.closed = False
+        bands = np.ndarray((handle.n_bands, len(BAND_COLUMNS)), dtype=float, buffer=shm.buf)
+        bands.flags.writeable = False
+        self.models = {
+            key: SharedTaxModel(
+                tax_rules=[SharedBandsGroup(bands[r.start:r.stop], r.allowance, r.name, self) for r in layout.rules],
+                year=layout.year,
+                name=layout.name,
+                non_sequential=layout.non_sequential,
+            )
+            for key, layout in handle.models.items()
+        }
+
+    @classmethod
+    def publish(cls, models: Dict[Key, TaxModel]) -> "ModelRegistry":
+        """
+        Copies the bands of `models` into a new shared memory block.
+
+        Args:
+            models (Dict[Key, TaxModel]): Models keyed by (regime, year), e.g. from `load_models`.
+
+        Returns:
+            ModelRegistry: The owning registry; call `unlink` (or use it as a context manager) when done.
+        """
+        arrays = []
+        layouts = {}
+        start = 0
+        for key, model in models.items():
+            rules = []
+            for rule in model.tax_rules:
+                array = rule.to_array()
+                rules.append(RuleLayout(name=rule.name, allowance=rule.allowance, start=start, stop=start + len(array)))
+                arrays.append(array)
+                start += len(array)
+            layouts[key] = ModelLayout(name=model.name, year=model.year, non_sequential=model.non_sequential,
+                                       rules=rules)
+        bands = np.concatenate(arrays) if arrays else np.empty((0, len(BAND_COLUMNS)))
+        shm = shared_memory.SharedMemory(create=True, size=max(bands.nbytes, 1))
+        np.ndarray(bands.shape, dtype=float, buffer=shm.buf)[:] = bands
+        handle = RegistryHandle(shm_name=shm.name, n_bands=len(bands), models=layouts)
+        return cls(handle=handle, shm=shm, owner=True)
+
+    @classmethod
+    def attach(cls, handle: RegistryHandle) -> "ModelRegistry":
+        """Attaches to a registry published by another process."""
+        return cls(handle=handle, shm=_attach_shared_memory(handle.shm_name), owner=False)
+
+    def __getitem__(self, key: Key) -> SharedTaxModel:
+        try:
+            return self.models[key]
+        except KeyError:
+            raise KeyError(f"No model registered for regime '{key[0]}' in {key[1]}")
+
+    def keys(self) -> List[Key]:
+        return list(self.models)
+
+    def close(self):
+        """Detaches this process. Models from this registry raise `RuntimeError` if used afterwards."""
+        if self.closed:
+            return
+        self.closed = True
+        self.models = {}
+        self._shm.close()
+
+    def unlink(self):
+        """Closes and frees the shared memory block. Only the publishing process should call this."""
+        self.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> "ModelRegistry":
+        return self
+
+    def __exit__(self, *exc):
+        self.unlink()
+
+
+_worker_registry: ModelRegistry | None = None
+
+
+def init_worker(handle: RegistryHandle):
+    """Pool initializer: attaches the worker process to a published registry."""
+    global _worker_registry
+    _worker_registry = ModelRegistry.attach(handle)
+
+
+def get_shared_model(regime: str, year: int) -> SharedTaxModel:
+    """Looks up a model in the registry this worker attached to with `init_worker`."""
+    if _worker_registry is None:
+        raise RuntimeError("No registry attached; call init_worker(handle) in this process first")
+    return _worker_registry[(regime, year)]
+
+
+if __name__ == "__main__":
+    with ModelRegistry.publish(load_models()) as registry:
+        print(registry.keys())
+        print(registry[("autonomo", 2025)].results_array(np.array([20000, 40000])))
@@ -0,0 +1,47 @@
+import io
+import json
+
+import pandas as pd
+import pytest
+
+from cuota.cli import run, get_model, main
+
+
+def test_run_csv_matches_model():
+    source = io.StringIO("gross,regime,year\n30000,general,2024\n45000,,\n")
+    sink = io.StringIO()
+    assert run(source, sink, chunksize=1) == 2
+    df = pd.read_csv(io.StringIO(sink.getvalue()))
+    assert list(df["regime"]) == ["general", "autonomo"]
+    expected = get_model("autonomo", 2025).results(45000)
+    assert df["net"][1] == expected["take home"]
+    assert df["income tax"][1] == expected["Income Tax"]
+
+
+def test_run_jsonl_without_header():
+    source = io.StringIO("30000\n45000,general,2024\n")
+    sink = io.StringIO()
+    run(source, sink, output_format="jsonl", header=False)
+    rows = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert [row["regime"] for row in rows] == ["autonomo", "general"]
+    assert rows[1]["year"] == 2024
+
+
+def test_missing_input_file_is_reported(tmp_path, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main([str(tmp_path / "missing.csv")])
+    assert exit_info.value.code == 1
+    assert capsys.readouterr().err.startswith("cuota: error: cannot read")
+
+
+def test_uk_year_without_resources_is_rejected():
+    with pytest.raises(ValueError, match="2019"):
+        get_model("uk-employee", 2019)
+
+
+def test_uk_zero_conversion_rate_is_rejected(monkeypatch):
+    foreign_tax_rules = pytest.importorskip("cuota.data_classes.foreign_tax_rules")
+    monkeypatch.setattr(foreign_tax_rules, "get_conversion_rate", lambda: 0)
+    get_model.cache_clear()
+    with pytest.raises(ValueError, match="exchange rate"):
+        run(io.StringIO("gross\n30000\n"), io.StringIO(), regime="uk-self-employed", year=2025)
@@ -0,0 +1,33 @@
+import numpy as np
+
+from cuota.data_classes.spanish_tax_rules import SpanishAutonomoModel
+from cuota.logic.downsampling import lttb, downsample
+
+
+def test_lttb_keeps_ends_and_size():
+    x = np.arange(10000)
+    y = np.sin(x / 100)
+    indices = lttb(x, y, 500)
+    assert len(indices) == 500
+    assert indices[0] == 0 and indices[-1] == len(x) - 1
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_downsample_keeps_step_edges():
+    x = np.arange(100000)
+    y = np.where(x > 31415, 0.3, 0.2)
+    x_out, y_out = downsample(x, y, n_out=100)
+    assert 31415 in x_out and 31416 in x_out
+    assert len(x_out) <= 102
+
+
+def test_downsample_keeps_flat_charge_jumps_in_model_output():
+    # truncated model output changes by 0 or 1 unit at most points; only the cuota steps are edges
+    model = SpanishAutonomoModel(2025)
+    x = np.arange(1, 200001) * 0.5
+    results = model.results_array(x)
+    jumps = np.flatnonzero(np.diff(results["Social Security"]))
+    for metric in ["total payable", "Social Security effective rate"]:
+        x_out, _ = downsample(x, results[metric], n_out=500)
+        assert np.isin(x[jumps], x_out).all() and np.isin(x[jumps + 1], x_out).all()
+        assert len(x_out) <= 500 + 2 * 500
@@ -0,0 +1,30 @@
+import pytest
+
+from cuota.importers.manifest import scan_resources, load_manifest, get_resource, get_years
+from cuota.importers.import_tax_data import get_spanish_data_by_year, get_all_social_security_data
+
+
+def test_manifest_is_up_to_date():
+    # regenerate with `python -m cuota.importers.manifest` after changing cuota/resources
+    scanned = {(e["jurisdiction"], e["regime"], e["kind"], e["year"]): e["file"] for e in scan_resources()}
+    assert scanned == load_manifest()
+
+
+def test_get_resource():
+    assert get_resource("ES", "social_security", 2024, regime="autonomo") == "cuotas2024.csv"
+    assert get_resource("ES", "income_tax", 2024, regime="autonomo") == "irpf_tramos2024.csv"
+    with pytest.raises(FileNotFoundError):
+        get_resource("ES", "income_tax", 1999)
+
+
+def test_spanish_data_matched_by_year():
+    years = get_years("ES", "social_security", regime="autonomo")
+    assert [model.year for model in get_spanish_data_by_year()] == years
+    assert [model.year for model in get_all_social_security_data()] == years
+
+
+def test_spanish_data_year_mismatch_raises(monkeypatch):
+    manifest = {key: fn for key, fn in load_manifest().items() if key != ("ES", "autonomo", "social_security", 2023)}
+    monkeypatch.setattr("cuota.importers.manifest.load_manifest", lambda: manifest)
+    with pytest.raises(Exception, match=r"irpf only \[2023\]"):
+        get_spanish_data_by_year()
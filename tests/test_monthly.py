@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from cuota.importers.import_tax_data import get_social_security_bands
+from cuota.logic.monthly import MonthlyContributionEngine
+
+
+def test_get_cuota_matches_bands():
+    engine = MonthlyContributionEngine(2025)
+    bands = get_social_security_bands(fn="cuotas2025.csv", annualized=False)
+    incomes = np.array([1, 670, 670.5, 1166, 1166.01, 4050, 6000.5, 20000])
+    assert list(engine.get_cuota(incomes)) == [bands.get_payable(i) for i in incomes]
+
+
+def test_get_cuota_clamps_to_lowest_and_highest_tramo():
+    engine = MonthlyContributionEngine(2025)
+    # zero-income and loss-making months still owe the lowest tramo
+    assert list(engine.get_cuota(np.array([0, -350, 20000000]))) == [200, 200, 590]
+
+
+def test_zero_average_income_owes_lowest_tramo():
+    result = MonthlyContributionEngine(2025).calculate(np.array([[0] * 6 + [-100] * 6]))
+    assert list(result.paid) == [12 * 200]
+    assert list(result.due) == [12 * 200]
+    assert list(result.regularization) == [0]
+
+
+def test_regularization_against_average_income():
+    engine = MonthlyContributionEngine(2025)
+    # six months at 500 (cuota 200) and six at 2500 (cuota 415): average 1500 falls in 1300-1500 (cuota 294)
+    incomes = np.array([[500] * 6 + [2500] * 6, [2000] * 12])
+    result = engine.calculate(incomes)
+    assert list(result.paid) == [6 * 200 + 6 * 415, 12 * 370]
+    assert list(result.due) == [12 * 294, 12 * 370]
+    assert list(result.regularization) == [12 * 294 - 6 * 200 - 6 * 415, 0]
+
+
+def test_calculate_rejects_wrong_shape():
+    with pytest.raises(ValueError):
+        MonthlyContributionEngine(2025).calculate(np.zeros((3, 11)))
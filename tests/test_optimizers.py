@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from cuota.data_classes.spanish_tax_rules import SpanishAutonomoModel, SpanishRegimenGeneralModel
+from cuota.logic.optimizers import optimal_split, optimal_split_by_year
+
+
+@pytest.mark.parametrize("year", [2022, 2023, 2024, 2025])
+def test_optimal_split_matches_grid_search(year):
+    employment = SpanishRegimenGeneralModel(year)
+    self_employment = SpanishAutonomoModel(year)
+    # 49658 in 2022 falls 2 short: truncation costs up to a unit in each model
+    totals = np.append(np.arange(5000, 150000, 4700), 49658)
+    result = optimal_split(employment, self_employment, totals)
+    for total, take_home in zip(totals, result.take_home):
+        split = np.arange(0, total + 1)
+        grid = employment.take_home_array(split) + self_employment.take_home_array(total - split)
+        assert take_home >= grid.max() - 2
+    np.testing.assert_array_equal(result.employment, np.round(result.employment))
+    np.testing.assert_allclose(result.employment + result.self_employment, totals)
+
+
+def test_optimal_split_above_social_security_ceiling():
+    # régimen general social security stops above 200,000, so take-home jumps up just past that breakpoint
+    totals = np.array([210000, 247265, 300000])
+    for year in [2023, 2024]:
+        employment = SpanishRegimenGeneralModel(year)
+        self_employment = SpanishAutonomoModel(year)
+        result = optimal_split(employment, self_employment, totals)
+        for total, take_home in zip(totals, result.take_home):
+            split = np.arange(0, total + 1)
+            grid = employment.take_home_array(split) + self_employment.take_home_array(total - split)
+            # only whole-unit truncation within a segment can beat the breakpoints
+            assert take_home >= grid.max() - 2
+
+
+def test_optimal_split_by_year_shape():
+    totals = np.arange(20000, 60000, 10000)
+    result = optimal_split_by_year(totals=totals, years=[2024, 2025])
+    assert result.take_home.shape == (2, len(totals))
+    assert result.years == [2024, 2025]
@@ -0,0 +1,43 @@
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from cuota.logic.models import load_models
+from cuota.logic.registry import ModelRegistry, init_worker, get_shared_model
+
+AMOUNTS = np.arange(1000, 120000, 1300)
+
+
+def _take_home(key):
+    return get_shared_model(*key).take_home_array(AMOUNTS)
+
+
+def test_registry_matches_models():
+    models = load_models()
+    with ModelRegistry.publish(models) as registry:
+        for key, model in models.items():
+            shared = registry[key]
+            for name, values in model.results_array(AMOUNTS).items():
+                np.testing.assert_array_equal(shared.results_array(AMOUNTS)[name], values)
+
+
+def test_models_raise_after_registry_is_closed():
+    with ModelRegistry.publish(load_models()) as registry:
+        model = registry[("autonomo", 2025)]
+        model.take_home_array(AMOUNTS)
+    with pytest.raises(RuntimeError):
+        model.take_home_array(AMOUNTS)
+
+
+@pytest.mark.parametrize("method", ["spawn", "fork"])
+def test_workers_attach_by_key(method):
+    if method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{method} not available")
+    models = load_models()
+    with ModelRegistry.publish(models) as registry:
+        context = multiprocessing.get_context(method)
+        with context.Pool(2, initializer=init_worker, initargs=(registry.handle,)) as pool:
+            results = pool.map(_take_home, list(models))
+    for key, take_home in zip(models, results):
+        np.testing.assert_array_equal(take_home, models[key].take_home_array(AMOUNTS))
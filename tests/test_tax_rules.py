@@ -1,5 +1,10 @@
 import logging
-from cuota.data_classes.tax_rules import Band, BandsGroup, TaxModel
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cuota.data_classes.tax_rules import Band, BandsGroup, TaxModel, IncomeSample
 from cuota.importers.import_tax_data import get_social_security_bands, get_income_tax_bands
 
 logger = logging.getLogger()
@@ -49,3 +54,42 @@ def test_import_bandgroup_social_security():
 
 
 
+def test_TaxModel_results_array_matches_results():
+    model = TaxModel(tax_rules=[get_social_security_bands(), get_income_tax_bands()])
+    amounts = np.arange(1000, 90000, 1700)
+    results = model.results_array(amounts)
+    for i, amount in enumerate(amounts):
+        expected = model.results(int(amount))
+        for key, value in expected.items():
+            assert results[key][i] == pytest.approx(value)
+
+
+def test_BandsGroup_breakpoints_include_allowance():
+    bands = [Band(floor=0, ceiling=10000, rate=0.1), Band(floor=10000, ceiling=20000, rate=0.2)]
+    bandsgroup = BandsGroup(bands=bands, allowance=5000)
+    assert list(bandsgroup.breakpoints()) == [5000, 15000, 25000]
+
+
+def test_IncomeSample_series_cache_and_plot_all():
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    model = TaxModel(tax_rules=[get_social_security_bands(), get_income_tax_bands()])
+    amounts = np.arange(1000, 90000, 10)
+    sample = IncomeSample(df=pd.DataFrame(model.results_array(amounts), index=amounts), max_points=200)
+    first = sample.series("take home")
+    assert sample.series("take home") is first
+    assert len(first[0]) < len(amounts)
+
+    # assigning a new frame must not plot the old series
+    sample.df = sample.df * 2
+    np.testing.assert_array_equal(sample.series("take home")[1][[0, -1]], first[1][[0, -1]] * 2)
+
+    fig = sample.plot_all()
+    amount_ax, rate_ax = fig.axes
+    assert {line.get_label() for line in amount_ax.get_lines()} == {
+        "Social Security", "Income Tax", "total payable", "take home"
+    }
+    assert all("rate" in line.get_label() for line in rate_ax.get_lines())
+    plt.close(fig)